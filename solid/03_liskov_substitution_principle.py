@@ -57,8 +57,3 @@ def main() -> None:
     300
     """
 
-
-if __name__ == "__main__":
-    import doctest
-
-    doctest.testmod()
@@ -10,6 +10,11 @@ that it does not use, only to implement noop methods in places.
 
 from abc import ABC, abstractmethod
 
+# The rectified interfaces below are structural; `typing_extensions` ships
+# hand optimised runtime checkable protocols that are considerably faster
+# for `isinstance` checks than the stdlib `typing` equivalents on <3.12.
+from typing_extensions import Protocol, runtime_checkable
+
 
 class IDevice(ABC):
     """
@@ -99,31 +104,31 @@ better reusability and maintainability of our code.  Let's try solve this below:
 # ------------------------------------------ Violations ------------------------------------------
 
 
-class ISendSms(ABC):
+@runtime_checkable
+class ISendSms(Protocol):
     """
     A simple interface for sending text based messages.
     """
 
-    @abstractmethod
     def send_sms(self, content: str, recipient: str) -> None:
         raise NotImplementedError
 
 
-class ILaunchApp(ABC):
+@runtime_checkable
+class ILaunchApp(Protocol):
     """
     A simple interface for launching apps.
     """
 
-    @abstractmethod
     def launch_app(self, app_name: str) -> None:
         raise NotImplementedError
 
 
-class IViewWebPage(ABC):
+@runtime_checkable
+class IViewWebPage(Protocol):
     """
     A simple interface for viewing web pages.
     """
 
-    @abstractmethod
     def view_webpage(self, target: str) -> None:
         raise NotImplementedError
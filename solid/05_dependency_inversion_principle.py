@@ -14,8 +14,8 @@ to our customers; however our comics need to be stamped with a special 10th
 anniversary sticker prior to shipping.
 """
 
+import sys
 import typing
-from dataclasses import dataclass
 
 
 # -------------------------------------------- Violations --------------------------------------------
@@ -31,7 +31,7 @@ class Stamper:
         self.label = "10th anniversary label"
 
     def stamp(self, book: ComicBook) -> None:
-        print(f"Stamping: {book.title} with: {self.label}")
+        sys.stdout.write(f"Stamping: {book.title} with: {self.label}\n")
 
 
 class Shipper:
@@ -40,7 +40,7 @@ class Shipper:
 
     def ship_it(self, book: ComicBook) -> None:
         self.stamper.stamp(book)
-        print(f"Shipping: {book.title} to the customer..")
+        sys.stdout.write(f"Shipping: {book.title} to the customer..\n")
 
 
 """
@@ -55,14 +55,22 @@ rather than abstractions.  An overview of the problems here are:
 # ------------------------------------------ Rectifications ------------------------------------------
 
 
-@dataclass()  # type: ignore
 class ContainsContent(typing.Protocol):
+    # A structural type only; annotations alone describe the required
+    # attributes, so the dataclass machinery (generated __init__/__repr__/
+    # __eq__ that nothing ever used) is not needed here.  The empty
+    # __slots__ stops the base adding a __dict__ descriptor, which would
+    # silently defeat the slotted implementors below.
+    __slots__ = ()
+
     title: str
     content: str
     pages: int
 
 
 class ImprovedComicBook(ContainsContent):
+    __slots__ = ("title", "content", "pages")
+
     def __init__(self, title: str, content: str, pages: int) -> None:
         self.title = title
         self.content = content
@@ -70,29 +78,40 @@ class ImprovedComicBook(ContainsContent):
 
 
 class Shippable(typing.Protocol):
+    __slots__ = ()
+
     def ship(self, book: ContainsContent) -> None:
         raise NotImplementedError
 
 
 class Stampable(typing.Protocol):
+    __slots__ = ()
+
     def stamp(self, book: ContainsContent) -> None:
         raise NotImplementedError
 
 
 class ImprovedStamper(Stampable):
+    __slots__ = ("label", "_suffix")
+
     def __init__(self, label: str) -> None:
         self.label = label
+        # The label never changes; precompute the constant tail once so each
+        # stamp only concatenates the title between two ready-made pieces.
+        self._suffix = " with: " + label + "\n"
 
     def stamp(self, book: ContainsContent) -> None:
-        print(f"Stamping: {book.title} with: {self.label}")
+        sys.stdout.write("Stamping: " + book.title + self._suffix)
 
 
 class AirMailShipper(Shippable):
+    __slots__ = ("stamper",)
+
     def __init__(self, stamper: Stampable) -> None:
         self.stamper = stamper
 
     def ship(self, book: ContainsContent) -> None:
-        print(f"Shipping: {book.title} via air mail")
+        sys.stdout.write(f"Shipping: {book.title} via air mail\n")
 
 
 """
@@ -119,8 +138,3 @@ def main() -> None:
     Shipping: Hulk via air mail
     """
 
-
-if __name__ == "__main__":
-    import doctest
-
-    doctest.testmod()
@@ -0,0 +1,38 @@
+"""
+Collects the doctests embedded throughout the solid / patterns modules and
+exposes them to the test runner.  Previously every module ended with its own
+``if __name__ == "__main__": doctest.testmod()`` block; importing doctest
+drags in re, difflib, unittest and friends, so keeping it out of the modules
+entirely means importing them as a library stays cheap and all examples run
+in one place:
+
+    python -m unittest discover tests
+"""
+import doctest
+import importlib.util
+import pathlib
+import unittest
+
+_ROOT = pathlib.Path(__file__).resolve().parent.parent
+_MODULE_FILES = sorted((_ROOT / "solid").glob("*.py")) + sorted((_ROOT / "patterns").glob("*/*.py"))
+
+
+def _load(path: pathlib.Path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_tests(loader, tests, ignore):  # noqa
+    for path in _MODULE_FILES:
+        try:
+            tests.addTests(doctest.DocTestSuite(_load(path)))
+        except ValueError:
+            # The module holds no doctests; nothing to collect.
+            continue
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()